@@ -20,6 +20,124 @@ Technical Implementation:
 5. Form validation through HTML5 required attribute
 """
 
+import sys
+from types import MappingProxyType
+
+# Static specification data, built once at import time and frozen so the
+# shared objects returned by the get_* methods cannot be modified
+_HTML_STRUCTURE = MappingProxyType({
+    'doctype': 'HTML5',
+    'html_lang': 'en',
+    'head': MappingProxyType({
+        'charset': 'UTF-8',
+        'viewport': 'width=device-width, initial-scale=1.0',
+        'stylesheet': 'style.css (relative path)'
+    }),
+    'body': MappingProxyType({
+        'header': MappingProxyType({
+            'h1': 'Crumble Bakery (brand name)'
+        }),
+        'main': MappingProxyType({
+            'h2': 'Coming Soon',
+            'form': MappingProxyType({
+                'method': 'POST',
+                'input': MappingProxyType({
+                    'type': 'email',
+                    'required': True,
+                    'accessibility': 'aria-label and visually-hidden label'
+                }),
+                'button': MappingProxyType({
+                    'type': 'submit',
+                    'text': 'Notify Me'
+                })
+            })
+        }),
+        'footer': MappingProxyType({
+            'social_links': ('Instagram', 'Facebook', 'Twitter'),
+            'contact_info': MappingProxyType({
+                'email': 'hello@crumblebakery.com',
+                'address': '123 Baker Street, Sweet City, SC 12345'
+            })
+        })
+    })
+})
+
+_CSS_ARCHITECTURE = MappingProxyType({
+    'approach': 'Mobile-First Responsive Design',
+    'layout_engine': 'CSS Flexbox',
+    'reset': 'Universal box-sizing and margin/padding reset',
+    'centering': MappingProxyType({
+        'vertical': 'min-height: 100vh + justify-content: center',
+        'horizontal': 'align-items: center'
+    }),
+    'typography': 'System font stack (system-ui, sans-serif)',
+    'color_management': 'CSS Custom Properties (:root variables)',
+    'responsive_strategy': MappingProxyType({
+        'mobile': 'Default styles (0-479px)',
+        'desktop': 'Single @media query at 480px+',
+        'form_layout': MappingProxyType({
+            'mobile': 'flex-direction: column',
+            'desktop': 'flex-direction: row'
+        })
+    }),
+    'interaction_states': MappingProxyType({
+        'hover_effects': 'Color changes only (no transitions)',
+        'focus_states': 'Border and box-shadow for accessibility'
+    })
+})
+
+_ACCESSIBILITY_FEATURES = (
+    'Semantic HTML5 elements (header, main, footer, address)',
+    'Proper form labeling with visually-hidden labels',
+    'ARIA labels for screen readers',
+    'Focus states for keyboard navigation',
+    'High contrast color palette for readability',
+    'Responsive design for various screen sizes',
+    'HTML5 form validation with required attributes'
+)
+
+_PERFORMANCE_OPTIMIZATIONS = (
+    'No external font requests (system font stack)',
+    'No JavaScript reduces bundle size',
+    'Minimal CSS with efficient selectors',
+    'CSS custom properties for maintainable theming',
+    'Single media query reduces complexity',
+    'Optimized image-free design with CSS styling',
+    'Clean HTML structure for fast parsing'
+)
+
+
+def to_plain_data(value):
+    """
+    Convert frozen specification data back into plain Python containers.
+    
+    Args:
+        value: A value returned by one of the ``get_*`` methods or by
+            ``generate_implementation_report``
+    
+    Returns:
+        A deep copy with every MappingProxyType turned into a dict and every
+        tuple into a list, suitable for ``json.dumps`` or mutation
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: to_plain_data(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [to_plain_data(item) for item in value]
+    return value
+
+
+# Architecture requirements checked by validate_architecture_compliance,
+# in report order; __init__ asserts its compliance keys match this tuple
+_COMPLIANCE_REQUIREMENTS = (
+    'file_count', 'no_javascript', 'no_external_libs', 'semantic_html',
+    'mobile_first_css', 'single_media_query', 'form_validation',
+    'accessibility_features'
+)
+
+# Display labels for the compliance report keys
+_PRETTY = {k: k.replace('_', ' ').title() for k in _COMPLIANCE_REQUIREMENTS}
+
+
 class CrumbleBakeryImplementation:
     """
     Documentation class for the Crumble Bakery coming soon page implementation.
@@ -47,15 +165,7 @@ class CrumbleBakeryImplementation:
         self.max_lines_per_file = 200
         self.uses_javascript = False
         self.uses_external_libraries = False
-        
-    def validate_architecture_compliance(self):
-        """
-        Validate that implementation meets all architectural requirements.
-        
-        Returns:
-            dict: Compliance status for each requirement
-        """
-        compliance_check = {
+        self._compliance = MappingProxyType({
             'file_count': self.file_count == 2,
             'no_javascript': not self.uses_javascript,
             'no_external_libs': not self.uses_external_libraries,
@@ -64,127 +174,67 @@ class CrumbleBakeryImplementation:
             'single_media_query': True,  # @media (min-width: 480px)
             'form_validation': True,  # HTML5 required attribute
             'accessibility_features': True  # ARIA labels, semantic tags
-        }
+        })
+        assert tuple(self._compliance) == _COMPLIANCE_REQUIREMENTS
+        self._report = self._build_implementation_report()
+        
+    def validate_architecture_compliance(self):
+        """
+        Validate that implementation meets all architectural requirements.
+        
+        The checks only depend on values fixed in ``__init__``, so they are
+        evaluated once there and the same read-only mapping is returned on
+        every call.
         
-        return compliance_check
+        Returns:
+            MappingProxyType: Read-only compliance status for each requirement
+        """
+        return self._compliance
     
     def get_html_structure(self):
         """
         Return the semantic HTML structure specification.
         
         Returns:
-            dict: HTML element hierarchy and attributes
+            MappingProxyType: Read-only HTML element hierarchy and attributes
         """
-        return {
-            'doctype': 'HTML5',
-            'html_lang': 'en',
-            'head': {
-                'charset': 'UTF-8',
-                'viewport': 'width=device-width, initial-scale=1.0',
-                'stylesheet': 'style.css (relative path)'
-            },
-            'body': {
-                'header': {
-                    'h1': 'Crumble Bakery (brand name)'
-                },
-                'main': {
-                    'h2': 'Coming Soon',
-                    'form': {
-                        'method': 'POST',
-                        'input': {
-                            'type': 'email',
-                            'required': True,
-                            'accessibility': 'aria-label and visually-hidden label'
-                        },
-                        'button': {
-                            'type': 'submit',
-                            'text': 'Notify Me'
-                        }
-                    }
-                },
-                'footer': {
-                    'social_links': ['Instagram', 'Facebook', 'Twitter'],
-                    'contact_info': {
-                        'email': 'hello@crumblebakery.com',
-                        'address': '123 Baker Street, Sweet City, SC 12345'
-                    }
-                }
-            }
-        }
+        return _HTML_STRUCTURE
     
     def get_css_architecture(self):
         """
         Return the CSS architecture and styling approach.
         
         Returns:
-            dict: CSS structure and methodologies used
+            MappingProxyType: Read-only CSS structure and methodologies used
         """
-        return {
-            'approach': 'Mobile-First Responsive Design',
-            'layout_engine': 'CSS Flexbox',
-            'reset': 'Universal box-sizing and margin/padding reset',
-            'centering': {
-                'vertical': 'min-height: 100vh + justify-content: center',
-                'horizontal': 'align-items: center'
-            },
-            'typography': 'System font stack (system-ui, sans-serif)',
-            'color_management': 'CSS Custom Properties (:root variables)',
-            'responsive_strategy': {
-                'mobile': 'Default styles (0-479px)',
-                'desktop': 'Single @media query at 480px+',
-                'form_layout': {
-                    'mobile': 'flex-direction: column',
-                    'desktop': 'flex-direction: row'
-                }
-            },
-            'interaction_states': {
-                'hover_effects': 'Color changes only (no transitions)',
-                'focus_states': 'Border and box-shadow for accessibility'
-            }
-        }
+        return _CSS_ARCHITECTURE
     
     def get_accessibility_features(self):
         """
         Document accessibility features implemented.
         
         Returns:
-            list: Accessibility enhancements included
+            tuple: Accessibility enhancements included
         """
-        return [
-            'Semantic HTML5 elements (header, main, footer, address)',
-            'Proper form labeling with visually-hidden labels',
-            'ARIA labels for screen readers',
-            'Focus states for keyboard navigation',
-            'High contrast color palette for readability',
-            'Responsive design for various screen sizes',
-            'HTML5 form validation with required attributes'
-        ]
+        return _ACCESSIBILITY_FEATURES
     
     def get_performance_optimizations(self):
         """
         Document performance considerations.
         
         Returns:
-            list: Performance optimization techniques used
+            tuple: Performance optimization techniques used
         """
-        return [
-            'No external font requests (system font stack)',
-            'No JavaScript reduces bundle size',
-            'Minimal CSS with efficient selectors',
-            'CSS custom properties for maintainable theming',
-            'Single media query reduces complexity',
-            'Optimized image-free design with CSS styling',
-            'Clean HTML structure for fast parsing'
-        ]
+        return _PERFORMANCE_OPTIMIZATIONS
     
-    def generate_implementation_report(self):
+    def _build_implementation_report(self):
         """
-        Generate a comprehensive implementation report.
+        Assemble the implementation report from the static specification data.
         
         Returns:
-            dict: Complete technical documentation
+            MappingProxyType: Read-only technical documentation
         """
-        return {
+        return MappingProxyType({
             'project_name': 'Crumble Bakery Coming Soon Page',
             'implementation_date': '2026-02-03',
             'architecture_compliance': self.validate_architecture_compliance(),
@@ -192,15 +242,28 @@ class CrumbleBakeryImplementation:
             'css_architecture': self.get_css_architecture(),
             'accessibility_features': self.get_accessibility_features(),
             'performance_optimizations': self.get_performance_optimizations(),
-            'file_statistics': {
+            'file_statistics': MappingProxyType({
                 'total_files': self.file_count,
                 'html_lines': '~50 lines',
                 'css_lines': '~180 lines',
                 'total_lines': '~230 lines (within 400 line limit)'
-            },
+            }),
             'browser_compatibility': 'Modern browsers with CSS Flexbox support',
             'deployment_ready': True
-        }
+        })
+    
+    def generate_implementation_report(self):
+        """
+        Generate a comprehensive implementation report.
+        
+        The report is assembled once in ``__init__`` and repeat calls return
+        the same object, so it and every nested section are read-only; pass
+        it through ``to_plain_data`` for a mutable or JSON-serializable copy.
+        
+        Returns:
+            MappingProxyType: Read-only technical documentation
+        """
+        return self._report
 
 
 # Usage Example and Validation
@@ -215,12 +278,16 @@ if __name__ == "__main__":
     compliance = bakery_impl.validate_architecture_compliance()
     all_compliant = all(compliance.values())
     
-    print("Crumble Bakery Implementation Status:")
-    print(f"Architecture Compliant: {all_compliant}")
-    print(f"Files Created: {report['file_statistics']['total_files']}")
-    print(f"Deployment Ready: {report['deployment_ready']}")
+    lines = [
+        "Crumble Bakery Implementation Status:",
+        f"Architecture Compliant: {all_compliant}",
+        f"Files Created: {report['file_statistics']['total_files']}",
+        f"Deployment Ready: {report['deployment_ready']}"
+    ]
     
     # Output compliance details
     for requirement, status in compliance.items():
         status_icon = "✓" if status else "✗"
-        print(f"{status_icon} {requirement.replace('_', ' ').title()}: {status}")
\ No newline at end of file
+        lines.append(f"{status_icon} {_PRETTY[requirement]}: {status}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")